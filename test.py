@@ -74,6 +74,9 @@ class TestNorm(object):
         assert PosixPath("a/./b").norm() == "a/b"
         assert PosixPath("a/./b", norm=True) == "a/b"
         assert PosixPath("a/./b", norm=False) == "a/./b"
+        # A path as the first argument is joined and normalized too.
+        assert PosixPath(PosixPath("a"), "../b", norm=True) == "b"
+        assert PosixPath(PosixPath("a"), "../b", norm=False) == "a/../b"
 
         class AutoNormPath(PosixPath):
             auto_norm = True
@@ -134,6 +137,7 @@ class TestAbstractPath(object):
         assert NTPath("\\foo\\bar.py").split_root() == ("\\", "foo\\bar.py")
         assert NTPath("C:\\foo\\bar.py").split_root() == ("C:\\", "foo\\bar.py")
         assert NTPath("C:foo\\bar.py").split_root() == ("C:", "foo\\bar.py")
+        assert NTPath("C:/foo/bar.py").split_root() == ("C:\\", "foo/bar.py")
         assert NTPath("\\\\share\\base\\foo\\bar.py").split_root() == ("\\\\share\\base\\", "foo\\bar.py")
 
     def test_split_root_vs_isabsolute(self):
@@ -157,12 +161,28 @@ class TestAbstractPath(object):
         assert P("a").components() == [P(""), P("a")]
         assert P("a/b/c").components() == [P(""), P("a"), P("b"), P("c")]
         assert P("/a/b/c").components() == [P("/"), P("a"), P("b"), P("c")]
+        assert P("//a//b/").components() == [P("/"), P("a"), P("b")]
+        assert P("./a/../b").components() == [P(""), P("."), P("a"), P(".."), P("b")]
         P = NTPath
         assert P("a\\b\\c").components() == [P(""), P("a"), P("b"), P("c")]
         assert P("\\a\\b\\c").components() == [P("\\"), P("a"), P("b"), P("c")]
         assert P("C:\\a\\b\\c").components() == [P("C:\\"), P("a"), P("b"), P("c")]
         assert P("C:a\\b\\c").components() == [P("C:"), P("a"), P("b"), P("c")]
         assert P("\\\\share\\b\\c").components() == [P("\\\\share\\b\\"), P("c")]
+        # A drive root keeps its separator even when it's altsep, so the
+        # components join back to the same absolute path.
+        assert P("C:/a/b").components() == [P("C:\\"), P("a"), P("b")]
+        assert P("C:/").components() == [P("C:\\")]
+        for p in ("C:/a/b", "C:/", "//a//b/"):
+            assert P(P(p).components()) == P(p).norm()
+
+    def test_ancestor(self):
+        P = PosixPath
+        p = P("/a/b/c/d.py")
+        assert p.ancestor(0) == p
+        assert p.ancestor(2) == P("/a/b")
+        assert p.ancestor(9) == P("/")
+        assert isinstance(p.ancestor(2), P)
 
     def test_child(self):
         PosixPath("foo/bar").child("baz")
@@ -371,6 +391,33 @@ class TestListingDirectories(FilesystemTest):
         ]
         assert result == control
 
+    def test_listdir_builtin_filters_match_predicates(self):
+        # The built-in filters may be answered from scandir entries;
+        # make sure that agrees with calling them on each Path.
+        class AutoNormPath(Path):
+            auto_norm = True
+        for f in (DIRS, FILES, LINKS, DIRS_NO_LINKS, FILES_NO_LINKS,
+                  DEAD_LINKS):
+            control = Path("").listdir(filter=lambda p: f(p))
+            assert Path("").listdir(filter=f) == control
+            control = self.d.listdir(filter=lambda p: f(p))
+            assert AutoNormPath(self.d).listdir(filter=f) == control
+
+    def test_listdir_walk_auto_norm(self):
+        class AutoNormPath(Path):
+            auto_norm = True
+        d = AutoNormPath(self.d)
+        result = d.child("images").listdir()
+        control = [
+            Path(self.images, "image1.gif"),
+            Path(self.images, "image2.jpg"),
+            Path(self.images, "image3.png")]
+        assert result == control
+        assert AutoNormPath("").listdir() == Path("").listdir()
+        result = list(d.walk())
+        control = list(self.d.walk())
+        assert result == control
+
     def test_listdir_pattern_names_only(self):
         result = self.images.name.listdir("*.jpg", names_only=True)
         control = ["image2.jpg"]
@@ -546,6 +593,13 @@ class TestCreateRenameRemove(FilesystemTest):
         assert not self.a_file.exists()
         self.missing.remove()  # Removing a nonexistent file should succeed.
 
+    def test_remove_rmdir_under_file(self):
+        # A path below a regular file doesn't exist either.
+        under_file = Path(self.a_file, "x")
+        under_file.remove()
+        under_file.rmdir()
+        self.missing.rmdir()
+
     if hasattr(os, 'symlink'):
         @pytest.mark.skipif("not hasattr(os, 'symlink')")
         def test_remove_broken_symlink(self):
@@ -588,6 +642,15 @@ class TestHighLevel(FilesystemTest):
         assert b_file.exists()
         a_file.copy_stat(b_file)
 
+    def test_copy_perms_only(self):
+        a_file = self.a_file
+        b_file = Path(a_file.parent, "b_file")
+        a_file.chmod(0o600)
+        a_file.set_times(50000)
+        a_file.copy(b_file, perms=True)
+        assert b_file.stat().st_mode & 0o777 == 0o600
+        assert b_file.mtime() != 50000
+
     def test_copy_tree(self):
         return  # .copy_tree() not implemented.
         images = self.images
@@ -616,8 +679,22 @@ class TestHighLevel(FilesystemTest):
         self.a_file.set_times()
         assert not self.a_file.needs_update(control_files[0])
 
+    def test_needs_update_dir(self):
+        self.a_file.set_times()
+        assert not self.a_file.needs_update(self.d.child("swedish"))
+        time.sleep(1)
+        self.chef.set_times()
+        assert self.a_file.needs_update(self.d.child("swedish"))
+
+        class AutoNormPath(Path):
+            auto_norm = True
+        # Walking the directories must work under auto_norm too.
+        assert AutoNormPath(self.a_file).needs_update(self.d.child("swedish"))
+        assert AutoNormPath(self.a_file).needs_update(self.d)
+
     def test_read_file(self):
         assert self.chef.read_file() == "bork!"
+        assert self.chef.read_file("U") == "bork!"
 
     # .write_file and .rmtree tested in .setUp.
 
@@ -15,8 +15,18 @@ if os.path.supports_unicode_filenames:
     except NameError:
         pass
 
+# Constructor argument types, looked up once here rather than by catching
+# NameError on every call.
+try:
+    _str_types = basestring
+    _int_types = (int, long)
+except NameError: # Python 3 doesn't have basestring nor long
+    _str_types = str
+    _int_types = (int,)
+
 class AbstractPath(_base):
     """An object-oriented approach to os.path functions."""
+    __slots__ = ()
     pathlib = os.path
     auto_norm = False
 
@@ -51,24 +61,21 @@ class AbstractPath(_base):
         # If no args, return "." or platform equivalent.
         if not args:
             return pathlib.curdir
-        # Avoid making duplicate instances of the same immutable path
-        if len(args) == 1 and isinstance(args[0], class_) and \
-            args[0].pathlib == pathlib:
-            return args[0]
-        try:
-            legal_arg_types = (class_, basestring, list, int, long)
-        except NameError: # Python 3 doesn't have basestring nor long
-            legal_arg_types = (class_, str, list, int)
+        if len(args) == 1:
+            arg = args[0]
+            # Avoid making duplicate instances of the same immutable path
+            if isinstance(arg, class_) and arg.pathlib == pathlib:
+                return arg
+            # A single plain string needs no type checks and no joining.
+            if type(arg) is str or type(arg) is _base:
+                return arg
+        legal_arg_types = (class_, _str_types, list) + _int_types
         args = list(args)
         for i, arg in enumerate(args):
             if not isinstance(arg, legal_arg_types):
                 m = "arguments must be str, unicode, list, int, long, or %s"
                 raise TypeError(m % class_.__name__)
-            try:
-                int_types = (int, long)
-            except NameError: # We are in Python 3
-                int_types = int
-            if isinstance(arg, int_types):
+            if isinstance(arg, _int_types):
                 args[i] = str(arg)
             elif isinstance(arg, class_) and arg.pathlib != pathlib:
                 arg = getattr(arg, components)()   # Now a list.
@@ -80,18 +87,29 @@ class AbstractPath(_base):
                 # Fall through to convert list of components.
             if isinstance(arg, list):
                 args[i] = pathlib.join(*arg)
+        # Join onto a plain string.  Given a path object, join()'s "+="
+        # would build an intermediate path object for every argument.
+        if isinstance(args[0], AbstractPath):
+            args[0] = _base(args[0])
         return pathlib.join(*args)
         
     def __repr__(self):
         return '%s(%r)' % (self.__class__.__name__, _base(self))
 
     def norm(self):
-        return self.__class__(self.pathlib.normpath(self))
+        newpath = self.pathlib.normpath(self)
+        if newpath == self:
+            return self    # Paths are immutable.
+        return self.__class__(newpath)
 
     def expand_user(self):
+        if not self.startswith("~"):
+            return self
         return self.__class__(self.pathlib.expanduser(self))
     
     def expand_vars(self):
+        if "$" not in self and "%" not in self:
+            return self
         return self.__class__(self.pathlib.expandvars(self))
     
     def expand(self):
@@ -101,9 +119,14 @@ class AbstractPath(_base):
         This is commonly everything needed to clean up a filename
         read from a configuration file, for example.
         """
-        newpath = self.pathlib.expanduser(self)
-        newpath = self.pathlib.expandvars(newpath)
+        newpath = self
+        if newpath.startswith("~"):
+            newpath = self.pathlib.expanduser(newpath)
+        if "$" in newpath or "%" in newpath:
+            newpath = self.pathlib.expandvars(newpath)
         newpath = self.pathlib.normpath(newpath)
+        if newpath == self:
+            return self
         return self.__class__(newpath)
 
     #### Properies: parts of the path.
@@ -127,7 +150,8 @@ class AbstractPath(_base):
         """Same as path.name but with one file extension stripped off.
            Example: path('/home/guido/python.tar.gz').stem => Path('python.tar')
         """
-        return self.__class__(self.pathlib.splitext(self.name)[0])
+        name = self.pathlib.basename(self)
+        return self.__class__(self.pathlib.splitext(name)[0])
     
     @property
     def ext(self):
@@ -143,80 +167,81 @@ class AbstractPath(_base):
            and the remainder is the entire path.
         """
         P = self.__class__
-        if hasattr(self.pathlib, "splitunc"):
-            root, rest = self.pathlib.splitunc(self)
-            if root:
-                if rest.startswith(self.pathlib.sep):
-                    root += self.pathlib.sep
-                    rest = rest[len(self.pathlib.sep):]
-                return P(root), P(rest)
-                # @@MO: Should test altsep too.
-        root, rest = self.pathlib.splitdrive(self)
+        pathlib = self.pathlib
+        sep, altsep = pathlib.sep, pathlib.altsep
+        root = ""
+        if hasattr(pathlib, "splitunc"):
+            root, rest = pathlib.splitunc(self)
+        if not root:
+            root, rest = pathlib.splitdrive(self)
         if root:
-            if rest.startswith(self.pathlib.sep):
-                root += self.pathlib.sep
-                rest = rest[len(self.pathlib.sep):]
+            # A drive or UNC root absorbs one following separator, which may
+            # be altsep ("C:/a").  Spell the root with sep either way.
+            if altsep:
+                root = root.replace(altsep, sep)
+            if rest.startswith(sep) or (altsep and rest.startswith(altsep)):
+                root += sep
+                rest = rest[1:]
             return P(root), P(rest)
-            # @@MO: Should test altsep too.
-        if self.startswith(self.pathlib.sep):
-            return P(self.pathlib.sep), P(rest[len(self.pathlib.sep):])
-        if self.pathlib.altsep and self.startswith(self.pathlib.altsep):
-            return P(self.pathlib.altsep), P(rest[len(self.pathlib.altsep):])
+        if self.startswith(sep):
+            return P(sep), P(rest[len(sep):])
+        if altsep and self.startswith(altsep):
+            return P(altsep), P(rest[len(altsep):])
         return P(""), self
 
     def components(self):
-        # @@MO: Had to prevent "" components from being appended.  I don't
-        # understand why Lindqvist didn't have this problem.
-        # Also, doesn't this fail to get the beginning components if there's
-        # a "." or ".." in the middle of the path?
+        # Split the remainder in one pass rather than calling
+        # pathlib.split() once per component, which rescans the string
+        # each time.  Empty components ("a//b", trailing separators) are
+        # dropped; "." and ".." are kept as-is.
         root, loc = self.split_root()
-        components = []
-        while loc != self.pathlib.curdir and loc != self.pathlib.pardir:
-            prev = loc
-            loc, child = self.pathlib.split(prev)
-            #print "prev=%r, loc=%r, child=%r" % (prev, loc, child)
-            if loc == prev:
-                break
-            if child != "":
-                components.append(child)
-            if loc == "":
-                break
-        if loc != "":
-            components.append(loc)
-        components.reverse()
+        sep = self.pathlib.sep
+        altsep = self.pathlib.altsep
+        if altsep:
+            loc = loc.replace(altsep, sep)
+        components = [x for x in loc.split(sep) if x != ""]
         components.insert(0, root)
         return [self.__class__(x) for x in components]
 
     def ancestor(self, n):
+        # Strip plain strings and build one path at the end, rather than
+        # a path object per level via .parent.
+        dirname = self.pathlib.dirname
         p = self
         for i in range(n):
-            p = p.parent
-        return p
+            p = dirname(p)
+        return self.__class__(p)
 
     def child(self, *children):
         # @@MO: Compare against Glyph's method.
+        pathlib = self.pathlib
+        sep, altsep = pathlib.sep, pathlib.altsep
         for child in children:
-            if self.pathlib.sep in child:
+            if sep in child:
                 msg = "arg '%s' contains path separator '%s'"
-                tup = child, self.pathlib.sep
+                tup = child, sep
                 raise UnsafePathError(msg % tup)
-            if self.pathlib.altsep and self.pathlib.altsep in child:
+            if altsep and altsep in child:
                 msg = "arg '%s' contains alternate path separator '%s'"
-                tup = child, self.pathlib.altsep
+                tup = child, altsep
                 raise UnsafePathError(msg % tup)
-            if child == self.pathlib.pardir:
+            if child == pathlib.pardir:
                 msg = "arg '%s' is parent directory specifier '%s'"
-                tup = child, self.pathlib.pardir
+                tup = child, pathlib.pardir
                 raise UnsafePathError(msg % tup)
-            if child == self.pathlib.curdir:    
+            if child == pathlib.curdir:    
                 msg = "arg '%s' is current directory specifier '%s'"
-                tup = child, self.pathlib.curdir
+                tup = child, pathlib.curdir
                 raise UnsafePathError(msg % tup)
-        newpath = self.pathlib.join(self, *children)
+        # Join onto a plain string to avoid intermediate path objects.
+        newpath = pathlib.join(_base(self), *children)
         return self.__class__(newpath)
 
     def norm_case(self):
-        return self.__class__(self.pathlib.normcase(self))
+        newpath = self.pathlib.normcase(self)
+        if newpath == self:
+            return self
+        return self.__class__(newpath)
     
     def isabsolute(self):
         """True if the path is absolute.
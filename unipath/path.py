@@ -20,7 +20,7 @@ import sys
 import time
 import warnings
 
-from unipath.abstractpath import AbstractPath
+from unipath.abstractpath import AbstractPath, _base
 from unipath.errors import RecursionError
 
 __all__ = ["Path"]
@@ -40,7 +40,49 @@ def flatten(iterable):
         else:
             yield elm
 
+def _lstat_mode(p):
+    """Return the lstat mode of 'p', or 0 if it can't be stat'ed.
+       Lets a filter answer a compound question with a single syscall.
+    """
+    try:
+        return os.lstat(p).st_mode
+    except (OSError, ValueError):
+        return 0
+
+#### FILTER FUNCTIONS (PUBLIC) ####
+def DIRS(p):  return p.isdir()
+def FILES(p):  return p.isfile()
+def LINKS(p):  return p.islink()
+def DIRS_NO_LINKS(p):  return stat.S_ISDIR(_lstat_mode(p))
+def FILES_NO_LINKS(p):  return stat.S_ISREG(_lstat_mode(p))
+def DEAD_LINKS(p):  return p.islink() and not p.exists()
+
+# The same filters applied to an os.scandir() entry, which usually knows
+# its own type and so can answer without a stat.  Used by .listdir().
+_ENTRY_FILTERS = {
+    DIRS: lambda e: e.is_dir(),
+    FILES: lambda e: e.is_file(),
+    LINKS: lambda e: e.is_symlink(),
+    DIRS_NO_LINKS: lambda e: e.is_dir(follow_symlinks=False),
+    FILES_NO_LINKS: lambda e: e.is_file(follow_symlinks=False),
+    DEAD_LINKS: lambda e: e.is_symlink() and not os.path.exists(e.path),
+    }
+
+def _entry_is(entry, test):
+    """Apply an _ENTRY_FILTERS test, treating OSError as False the way the
+       os.path predicates do.
+    """
+    try:
+        return test(entry)
+    except os.error:
+        return False
+
+def _entry_isdir(entry):
+    """Same as os.path.isdir() but for an os.scandir() entry."""
+    return _entry_is(entry, _ENTRY_FILTERS[DIRS])
+
 class Path(AbstractPath):
+    __slots__ = ()
 
     ##### CURRENT DIRECTORY ####
     @classmethod
@@ -61,7 +103,9 @@ class Path(AbstractPath):
     def relative(self):
         """Return a relative path to self from the current working directory.
         """
-        return self.__class__.cwd().rel_path_to(self)
+        cwd = self.__class__.cwd()
+        # Hand rel_path_to() two absolute paths so it needn't call getcwd().
+        return cwd.rel_path_to(self.__class__(cwd, self))
 
     def rel_path_to(self, dst):
         """ Return a relative path from self to dst.
@@ -70,38 +114,27 @@ class Path(AbstractPath):
         ancestor.  If there's no common ancestor (e.g., they're are on 
         different Windows drives), the path will be absolute.
         """
-        origin = self.__class__(self).absolute()
+        # Look up the current directory at most once rather than once per
+        # absolute(), and not at all if both paths are already absolute.
+        if os.path.isabs(self) and os.path.isabs(dst):
+            origin = os.path.abspath(self)
+            dest = os.path.abspath(dst)
+        else:
+            cwd = os.getcwd()
+            origin = os.path.normpath(os.path.join(cwd, self))
+            dest = os.path.normpath(os.path.join(cwd, dst))
+        origin = self.__class__(origin)
         if not origin.isdir():
             origin = origin.parent
-        dest = self.__class__(dst).absolute()
-
-        orig_list = origin.norm_case().components()
-        # Don't normcase dest!  We want to preserve the case.
-        dest_list = dest.components()
 
-        if orig_list[0] != os.path.normcase(dest_list[0]):
-            # Can't get here from there.
+        # os.path.relpath() does the common-prefix walk on plain strings,
+        # comparing normcased components but keeping dest's own case.
+        try:
+            newpath = os.path.relpath(dest, origin)
+        except ValueError:
+            # Can't get here from there (e.g., different Windows drives).
             return self.__class__(dest)
-
-        # Find the location where the two paths start to differ.
-        i = 0
-        for start_seg, dest_seg in zip(orig_list, dest_list):
-            if start_seg != os.path.normcase(dest_seg):
-                break
-            i += 1
-
-        # Now i is the point where the two paths diverge.
-        # Need a certain number of "os.pardir"s to work up
-        # from the origin to the point of divergence.
-        segments = [os.pardir] * (len(orig_list) - i)
-        # Need to add the diverging part of dest_list.
-        segments += dest_list[i:]
-        if len(segments) == 0:
-            # If they happen to be identical, use os.curdir.
-            return self.__class__(os.curdir)
-        else:
-            newpath = os.path.join(*segments)
-            return self.__class__(newpath)
+        return self.__class__(newpath)
     
     def resolve(self):
         """Return an equivalent Path that does not contain symbolic links."""
@@ -112,6 +145,14 @@ class Path(AbstractPath):
     def listdir(self, pattern=None, filter=None, names_only=False):
         if names_only and filter is not None:
             raise TypeError("filter not allowed if 'names_only' is true")
+        if filter is not None and hasattr(os, "scandir"):
+            try:
+                entry_test = _ENTRY_FILTERS.get(filter)
+            except TypeError:   # Unhashable callable; can't be one of ours.
+                entry_test = None
+            if entry_test is not None:
+                return [x for x, entry in self._listdir_entries(pattern)
+                    if _entry_is(entry, entry_test)]
         empty_path = self == ""
         if empty_path:
             names = os.listdir(os.path.curdir)
@@ -122,31 +163,106 @@ class Path(AbstractPath):
         names.sort()
         if names_only:
             return names
-        ret = [self.child(x) for x in names]
+        P = self.__class__
+        prefix = self._child_prefix()
+        ret = [P(prefix + x) for x in names]
         if filter is not None:
             ret = [x for x in ret if filter(x)]
         return ret
 
+    def _child_prefix(self):
+        """Return self as a plain string with a trailing separator (or ""
+           for the empty path) for appending filenames that came from the
+           OS.  Concatenating is much cheaper than child() or
+           os.path.join(), which on a Path builds a throwaway intermediate
+           Path for every child.  It must not be a Path itself (nor be
+           joined as one): with auto_norm, the constructor would strip the
+           trailing separator.
+        """
+        return self.pathlib.join(_base(self), "")
+
+    def _listdir_isdir(self, pattern=None):
+        """Like .listdir(pattern) but return (child, is_dir) pairs.
+           Uses os.scandir() where available, which usually knows each
+           entry's type from the directory listing itself, so the is_dir
+           flags don't cost a stat per child.
+        """
+        if not hasattr(os, "scandir"):
+            return [(x, x.isdir()) for x in self.listdir(pattern)]
+        return [(x, _entry_isdir(entry))
+            for x, entry in self._listdir_entries(pattern)]
+
+    def _listdir_entries(self, pattern=None):
+        """Like .listdir(pattern) but return (child, DirEntry) pairs.
+           Requires os.scandir().
+        """
+        if self == "":
+            it = os.scandir(os.path.curdir)
+        else:
+            it = os.scandir(self)
+        try:
+            entries = dict((x.name, x) for x in it)
+        finally:
+            # Release the directory handle now, even on error.  The
+            # iterator only grew close() in Python 3.6.
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+        names = list(entries)
+        if pattern is not None:
+            names = fnmatch.filter(names, pattern)
+        names.sort()
+        P = self.__class__
+        prefix = self._child_prefix()
+        return [(P(prefix + x), entries[x]) for x in names]
+
     def walk(self, pattern=None, filter=None, top_down=True):
         return self._walk(pattern, filter, top_down=top_down, seen=set())
 
     def _walk(self, pattern, filter, top_down, seen):
-        if not self.isdir():
+        # Keep an explicit stack of (parent, children iterator) rather
+        # than recursing through nested generators, which would pass every
+        # item up through one generator frame per level of depth.
+        stack = [(None, iter(self._walk_children(pattern, seen)))]
+        while stack:
+            parent, children = stack[-1]
+            for child, is_dir in children:
+                if top_down and (filter is None or filter(child)):
+                    yield child
+                if is_dir:
+                    grandkids = child._walk_children(pattern, seen)
+                    # Bottom-up yields 'child' when its iterator runs out.
+                    stack.append((child, iter(grandkids)))
+                    break
+                if not top_down and (filter is None or filter(child)):
+                    yield child
+            else:
+                stack.pop()
+                if parent is not None and not top_down and \
+                    (filter is None or filter(parent)):
+                    yield parent
+
+    def _walk_children(self, pattern, seen):
+        """Return the (child, is_dir) pairs for one directory in a walk,
+           or nothing if the directory has already been visited.
+        """
+        try:
+            st = os.stat(self)
+        except os.error:
+            st = None
+        if st is None or not stat.S_ISDIR(st.st_mode):
             raise RecursionError("not a directory: %s" % self)
-        real_dir = self.resolve()
-        if real_dir in seen:
-            return  # We've already recursed this directory.
-        seen.add(real_dir)
-        for child in self.listdir(pattern):
-            is_dir = child.isdir()
-            if is_dir and not top_down:
-                for grandkid in child._walk(pattern, filter, top_down, seen):
-                    yield grandkid
-            if filter is None or filter(child):
-                yield child
-            if is_dir and top_down:
-                for grandkid in child._walk(pattern, filter, top_down, seen):
-                    yield grandkid
+        # Identify the directory by device and inode, which costs the one
+        # stat we needed anyway; resolve() would lstat every component.
+        # Fall back to resolve() if the platform has no inode numbers.
+        if st.st_ino:
+            dir_id = st.st_dev, st.st_ino
+        else:
+            dir_id = self.resolve()
+        if dir_id in seen:
+            return []  # We've already recursed this directory.
+        seen.add(dir_id)
+        return self._listdir_isdir(pattern)
                 
 
     #### STAT ATTRIBUTES ####
@@ -196,37 +312,57 @@ class Path(AbstractPath):
            Creates an empty file if the path does not exists.
            On some platforms (Windows), the path must not be a directory.
         """
-        if not self.exists():
-            fd = os.open(self, os.O_WRONLY | os.O_CREAT, 0o666)
-            os.close(fd)
         if mtime is None:
             mtime = time.time()
         if atime is None:
             atime = mtime
         times = atime, mtime
-        os.utime(self, times)
+        # Try the common case (the file exists) first instead of paying for
+        # an exists() stat on every call.
+        try:
+            os.utime(self, times)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            fd = os.open(self, os.O_WRONLY | os.O_CREAT, 0o666)
+            os.close(fd)
+            os.utime(self, times)
 
 
     #### CREATING, REMOVING, AND RENAMING ####
     def mkdir(self, parents=False, mode=0o777):
-        if self.exists():
-            return
-        if parents:
-            os.makedirs(self, mode)
-        else:
-            os.mkdir(self, mode)
+        # Attempt the creation and ignore an existing path, rather than
+        # stat'ing it first.
+        try:
+            if parents:
+                os.makedirs(self, mode)
+            else:
+                os.mkdir(self, mode)
+        except OSError as e:
+            # A dangling symlink also gives EEXIST; that was never ignored.
+            if e.errno != errno.EEXIST or not self.exists():
+                raise
 
     def rmdir(self, parents=False):
-        if not self.exists():
-            return
-        if parents:
-            os.removedirs(self)
-        else:
-            os.rmdir(self)
+        # Attempt the removal and ignore a missing directory, rather than
+        # stat'ing it first.
+        try:
+            if parents:
+                os.removedirs(self)
+            else:
+                os.rmdir(self)
+        except OSError:
+            # Only the error path stats: a missing path (ENOENT, or ENOTDIR
+            # under a regular file) is a no-op, as it always was.
+            if self.exists():
+                raise
 
     def remove(self):
-        if self.lexists():
+        try:
             os.remove(self)
+        except OSError:
+            if self.lexists():
+                raise
 
     def rename(self, new, parents=False):
         if parents:
@@ -280,9 +416,9 @@ class Path(AbstractPath):
 
     def copy_stat(self, dst, times=True, perms=True):
         st = os.stat(self)
-        if hasattr(os, 'utime'):
+        if times and hasattr(os, 'utime'):
             os.utime(dst, (st.st_atime, st.st_mtime))
-        if hasattr(os, 'chmod'):
+        if perms and hasattr(os, 'chmod'):
             m = stat.S_IMODE(st.st_mode)
             os.chmod(dst, m)
 
@@ -296,23 +432,32 @@ class Path(AbstractPath):
     def needs_update(self, others):
         if not isinstance(others, (list, tuple)):
             others = [others]
-        if not self.exists():
+        # One stat per path answers both "what type?" and "how old?".
+        try:
+            control = os.stat(self).st_mtime
+        except os.error:
             return True
-        control = self.mtime()
         for p in flatten(others):
-            if p.isdir():
-                for child in p.walk(filter=FILES):
-                    if child.mtime() > control:
+            st = os.stat(p)
+            if stat.S_ISDIR(st.st_mode):
+                for child in self.__class__(p).walk():
+                    try:
+                        st = os.stat(child)
+                    except os.error:
+                        continue   # Dead link.
+                    if stat.S_ISREG(st.st_mode) and st.st_mtime > control:
                         return True
-            elif p.mtime() > control:
+            elif st.st_mtime > control:
                 return True
         return False
                 
     def read_file(self, mode="rU"):
-        f = open(self, mode)
-        content = f.read()
-        f.close()
-        return content
+        # Python 3 text mode already translates newlines while decoding, and
+        # its "U" flag was removed in 3.11.
+        if sys.version_info[0] >= 3:
+            mode = mode.replace("U", "") or "r"
+        with open(self, mode) as f:
+            return f.read()
 
     def rmtree(self, parents=False):
         """Delete self recursively, whether it's a file or directory.
@@ -320,10 +465,12 @@ class Path(AbstractPath):
            doesn't exist, do nothing.
            If you're looking for a 'rmtree' method, this is what you want.
         """
-        if self.isfile() or self.islink():
-           os.remove(self)
-        elif self.isdir():
-           shutil.rmtree(self)
+        # One lstat decides; a symlink is removed, never followed.
+        mode = _lstat_mode(self)
+        if stat.S_ISDIR(mode):
+            shutil.rmtree(self)
+        elif mode:
+            os.remove(self)
         if not parents:
             return
         p = self.parent